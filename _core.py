@@ -0,0 +1,177 @@
+import re
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+from tzlocal import get_localzone
+
+local_tz = get_localzone()
+
+_MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12
+}
+_WEEKDAYS = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2,
+    'thursday': 3, 'friday': 4, 'saturday': 5, 'sunday': 6
+}
+_DEFAULT_TIMES = (("exam", (9, 0)), ("meeting", (15, 0)), ("appointment", (15, 0)))
+_TONIGHT_TIME = (19, 0)
+
+_MONTH_NAMES = '|'.join(_MONTHS)
+_WEEKDAY_NAMES = '|'.join(_WEEKDAYS)
+
+_DATETIME_RE = re.compile(r'''
+    (\d{1,2})(?:st|nd|rd|th)?\s+
+    (''' + _MONTH_NAMES + r''')
+    (?:\s+(\d{4}))?
+''', re.IGNORECASE | re.VERBOSE)
+_DATE_RE = re.compile(r'''
+    (''' + _MONTH_NAMES + r''')\s+
+    (\d{1,2})(?:st|nd|rd|th)?\b
+    (?:,?\s+(\d{4}))?
+''', re.IGNORECASE | re.VERBOSE)
+_ISO_DATE_RE = re.compile(r'\b\d{4}-\d{2}-\d{2}\b')
+_TIME_RE = re.compile(r'''
+    (?:\bat\s+)?
+    (?:\b(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?\s*(?P<period>[ap])\.?m\b\.?
+    |\b(?P<hour24>\d{1,2}):(?P<minute24>\d{2})\b
+    |\b(?P<noon>noon)\b
+    |\b(?P<midnight>midnight)\b)
+    |\bat\s+(?P<hour_at>\d{1,2})\b(?!(?:st|nd|rd|th)?\s+(?:''' + _MONTH_NAMES + r'''))
+''', re.IGNORECASE | re.VERBOSE)
+_CONNECTOR_ONLY_RE = re.compile(r'^\s*(also|don\'?t forget|and)\s*$', re.IGNORECASE)
+_PHRASE_RE = re.compile(
+    r'\b(?:(?P<dayafter>the day after)|(?P<today>today)|(?P<tonight>tonight)|(?P<tomorrow>tomorrow)|(?P<nextweek>next week)|'
+    r'(?:next\s+)?(?P<wd>' + _WEEKDAY_NAMES + r'))\b',
+    re.IGNORECASE
+)
+_PHRASE_RANKS = {kind: rank for rank, kind in enumerate(('dayafter', 'tomorrow', 'nextweek', 'today', 'tonight', 'wd'))}
+_CLEAN_RE = re.compile(r'\b(?:I have|on|at|a|also|don\'?t forget|morning|after)\b', re.IGNORECASE)
+_DEFAULT_TIME_RE = re.compile('|'.join(keyword for keyword, _ in _DEFAULT_TIMES))
+
+def assign_default_time(segment: str, lowered: Optional[str] = None) -> Tuple[int, int]:
+    found = set(_DEFAULT_TIME_RE.findall(lowered or segment.lower()))
+    for keyword, default_time in _DEFAULT_TIMES:
+        if keyword in found:
+            return default_time
+    return (12, 0)
+
+def _find_time(text: str) -> Optional[Tuple[int, int]]:
+    match = _TIME_RE.search(text)
+    if not match:
+        return None
+    if match.group('noon'):
+        return 12, 0
+    if match.group('midnight'):
+        return 0, 0
+    if match.group('hour24'):
+        return int(match.group('hour24')), int(match.group('minute24'))
+    if match.group('hour_at'):
+        return int(match.group('hour_at')), 0
+    hour = int(match.group('hour')) % 12
+    if match.group('period').lower() == 'p':
+        hour += 12
+    return hour, int(match.group('minute') or 0)
+
+def _at_time(date_obj: datetime, text: str) -> Tuple[datetime, bool]:
+    found = _find_time(text)
+    hour, minute = found or (0, 0)
+    return date_obj.replace(hour=hour, minute=minute, second=0, microsecond=0, tzinfo=None), found is not None
+
+def extract_date(
+    text: str,
+    current_date: datetime,
+    reference_date: Optional[datetime] = None,
+    lowered: Optional[str] = None
+) -> Tuple[Optional[datetime], bool, bool]:
+    try:
+        chainable = False
+        lowered = lowered or text.lower()
+        
+        phrase = min(
+            _PHRASE_RE.finditer(lowered),
+            key=lambda match: _PHRASE_RANKS[match.lastgroup or ''],
+            default=None
+        )
+        kind = phrase.lastgroup if phrase else None
+
+        if kind == 'dayafter':
+            chainable = True
+            base_date = reference_date or current_date
+            parsed_date = base_date + timedelta(days=1)
+            return (*_at_time(parsed_date, text), chainable)
+        
+        if kind == 'today':
+            return (*_at_time(current_date, text), False)
+
+        if kind == 'tonight':
+            parsed_date, timed = _at_time(current_date, text)
+            if not timed:
+                parsed_date = parsed_date.replace(hour=_TONIGHT_TIME[0], minute=_TONIGHT_TIME[1])
+            return parsed_date, True, False
+
+        if kind == 'tomorrow':
+            return (*_at_time(current_date + timedelta(days=1), text), False)
+        
+        if kind == 'nextweek':
+            return (*_at_time(current_date + timedelta(weeks=1), text), False)
+
+        match = _DATETIME_RE.search(text)
+        if match:
+            day, month, year = match.groups()
+            date_obj = datetime(int(year or current_date.year), _MONTHS[month.lower()], int(day))
+            if not year and date_obj.date() < current_date.date():
+                date_obj = date_obj.replace(year=date_obj.year + 1)
+            return (*_at_time(date_obj, text), False)
+
+        match = _DATE_RE.search(text)
+        if match:
+            month, day, year = match.groups()
+            date_obj = datetime(int(year or current_date.year), _MONTHS[month.lower()], int(day))
+            if not year and date_obj.date() < current_date.date():
+                date_obj = date_obj.replace(year=date_obj.year + 1)
+            return (*_at_time(date_obj, text), False)
+
+        match = _ISO_DATE_RE.search(text)
+        if match:
+            return (*_at_time(datetime.fromisoformat(match.group()), text), False)
+
+        if phrase and kind == 'wd':
+            days_ahead = (_WEEKDAYS[phrase.group('wd')] - current_date.weekday()) % 7
+            if days_ahead == 0:
+                days_ahead = 7
+            parsed_date = current_date + timedelta(days=days_ahead)
+            return (*_at_time(parsed_date, text), False)
+
+        return None, False, False
+
+    except Exception as e:
+        print(f"Date error: {str(e)}")
+        return None, False, False
+
+def process_event_segment(
+    segment: str,
+    current_date: datetime,
+    reference_date: Optional[datetime] = None
+) -> Tuple[Optional[str], Optional[datetime], bool]:
+    if _CONNECTOR_ONLY_RE.match(segment):
+        return None, None, False
+
+    lowered = segment.lower()
+    parsed_datetime, timed, chainable = extract_date(segment, current_date, reference_date, lowered)
+    if not parsed_datetime:
+        return None, None, False
+
+    summary_text = _TIME_RE.sub('', segment)
+    summary_text = _DATETIME_RE.sub('', summary_text)
+    summary_text = _DATE_RE.sub('', summary_text)
+    summary_text = _ISO_DATE_RE.sub('', summary_text)
+    summary_text = _PHRASE_RE.sub('', summary_text)
+    summary = _CLEAN_RE.sub('', summary_text).strip(' ,.-').capitalize()
+    if not summary:
+        summary = "Scheduled Event"
+
+    if not timed:
+        default_hour, default_min = assign_default_time(segment, lowered)
+        parsed_datetime = parsed_datetime.replace(hour=default_hour, minute=default_min)
+
+    return summary, parsed_datetime.replace(tzinfo=local_tz), chainable